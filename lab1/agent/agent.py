@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
 import wandb
 from pydantic import BaseModel
-from rich.progress import track
+from rich.progress import Progress
 
 from lab1.bandit.base import Bandit
 
@@ -12,6 +13,15 @@ class Results(BaseModel):
     reward: float
 
 
+def expand_active_arms(
+    active_arm_changes: list[tuple[int, int]], num_rounds: int
+) -> np.ndarray:
+    # Expand `(round, num_active_arms)` change points from `Agent.evaluate` into
+    # the active set size at the start of every round.
+    rounds, counts = zip(*active_arm_changes, strict=True)
+    return np.repeat(np.array(counts, dtype=np.int32), np.diff([*rounds, num_rounds]))
+
+
 class Agent(ABC):
     @abstractmethod
     def __init__(self, bandit: Bandit, log_to_wandb: bool = True):
@@ -23,40 +33,83 @@ class Agent(ABC):
     def play(self) -> Results:
         raise NotImplementedError
 
+    def num_active_arms(self) -> int:
+        # Number of arms the agent still considers on each round.
+        return self.bandit.n_arms
+
+    def committed_arm(self) -> int | None:
+        # Return an arm if every remaining call to `play` would select it, so
+        # `evaluate` can skip the rest of the horizon analytically.
+        return None
+
+    def commit(self, selected_arm: int, num_rounds: int, total_reward: float):
+        # Absorb `num_rounds` pulls of `selected_arm` summing to `total_reward`,
+        # as if `play` had been called that many times. Stateless by default.
+        return None
+
     def evaluate(self, num_rounds: int, log_frequency: int = 10):
         regret = 0.0
         total_reward = 0.0
-        cumulative_regret = []
-        cumulative_reward = []
+        cumulative_regret = np.empty(num_rounds)
+        cumulative_reward = np.empty(num_rounds)
+        # The active set only shrinks occasionally, so record change points
+        # rather than a value per round.
+        num_active_arms = self.num_active_arms()
+        active_arm_changes = [(0, num_active_arms)]
 
-        for i in track(range(num_rounds), description="Evaluating agent..."):
-            result = self.play()
-            instant_regret = (
-                self.bandit.best_arm_mean - self.bandit.arms[result.selected_arm].mean()
-            )
-            regret += instant_regret
-            total_reward += result.reward
-
-            cumulative_regret.append(regret)
-            cumulative_reward.append(total_reward)
-
-            self.step += 1
-
-            # Log to wandb at specified frequency
-            if self.log_to_wandb and (i + 1) % log_frequency == 0:
-                wandb.log(
-                    {
-                        "step": self.step,
-                        "round": i + 1,
-                        "instant_regret": instant_regret,
-                        "cumulative_regret": regret,
-                        "instant_reward": result.reward,
-                        "cumulative_reward": total_reward,
-                        "selected_arm": result.selected_arm,
-                        "average_regret": regret / (i + 1),
-                        "average_reward": total_reward / (i + 1),
-                    }
+        with Progress() as progress:
+            task = progress.add_task("Evaluating agent...", total=num_rounds)
+            for i in progress.track(range(num_rounds), task_id=task):
+                committed_arm = self.committed_arm()
+                if committed_arm is not None:
+                    regret, total_reward = self._fast_forward(
+                        committed_arm,
+                        i,
+                        num_rounds,
+                        regret,
+                        total_reward,
+                        cumulative_regret,
+                        cumulative_reward,
+                    )
+                    break
+
+                result = self.play()
+                instant_regret = (
+                    self.bandit.best_arm_mean
+                    - self.bandit.arms[result.selected_arm].mean()
                 )
+                regret += instant_regret
+                total_reward += result.reward
+
+                cumulative_regret[i] = regret
+                cumulative_reward[i] = total_reward
+                if self.num_active_arms() != num_active_arms:
+                    num_active_arms = self.num_active_arms()
+                    active_arm_changes.append((i + 1, num_active_arms))
+
+                self.step += 1
+
+                # Log to wandb at specified frequency
+                if self.log_to_wandb and (i + 1) % log_frequency == 0:
+                    wandb.log(
+                        {
+                            "step": self.step,
+                            "round": i + 1,
+                            "instant_regret": instant_regret,
+                            "cumulative_regret": regret,
+                            "instant_reward": result.reward,
+                            "cumulative_reward": total_reward,
+                            "selected_arm": result.selected_arm,
+                            "active_arms": num_active_arms,
+                            "average_regret": regret / (i + 1),
+                            "average_reward": total_reward / (i + 1),
+                        }
+                    )
+
+            # After a fast-forward, complete the bar rather than leave it where
+            # the jump started. This must follow the loop, since closing the
+            # tracked iterator resets the task to the rounds actually played.
+            progress.update(task, completed=num_rounds)
 
         # Final log
         if self.log_to_wandb:
@@ -74,4 +127,62 @@ class Agent(ABC):
             "total_reward": total_reward,
             "cumulative_regret": cumulative_regret,
             "cumulative_reward": cumulative_reward,
+            "active_arm_changes": active_arm_changes,
         }
+
+    def _fast_forward(
+        self,
+        selected_arm: int,
+        start_round: int,
+        num_rounds: int,
+        regret: float,
+        total_reward: float,
+        cumulative_regret: np.ndarray,
+        cumulative_reward: np.ndarray,
+    ) -> tuple[float, float]:
+        """Play `selected_arm` from `start_round` to the end in one step.
+
+        The regret increment is exact and the reward sum is drawn from its
+        distribution. Intermediate cumulative rewards are interpolated linearly
+        between the endpoints, i.e. their conditional mean given the sum.
+        """
+        remaining = num_rounds - start_round
+        instant_regret = (
+            self.bandit.best_arm_mean - self.bandit.arms[selected_arm].mean()
+        )
+        segment_reward = self.bandit.pull_sum(selected_arm, remaining)
+        self.commit(selected_arm, remaining, segment_reward)
+
+        # Fill both curves in place to avoid horizon-sized temporaries: build
+        # the offsets 1..remaining in the regret tail, derive the reward tail
+        # from them, then scale the regret tail.
+        regret_tail = cumulative_regret[start_round:]
+        regret_tail.fill(1.0)
+        np.cumsum(regret_tail, out=regret_tail)
+        reward_tail = cumulative_reward[start_round:]
+        np.multiply(regret_tail, segment_reward / remaining, out=reward_tail)
+        reward_tail += total_reward
+        regret_tail *= instant_regret
+        regret_tail += regret
+
+        regret += instant_regret * remaining
+        total_reward += segment_reward
+        self.step += remaining
+
+        if self.log_to_wandb:
+            wandb.log(
+                {
+                    "step": self.step,
+                    "round": num_rounds,
+                    "fast_forward_from_round": start_round,
+                    "instant_regret": instant_regret,
+                    "cumulative_regret": regret,
+                    "cumulative_reward": total_reward,
+                    "selected_arm": selected_arm,
+                    "active_arms": self.num_active_arms(),
+                    "average_regret": regret / num_rounds,
+                    "average_reward": total_reward / num_rounds,
+                }
+            )
+
+        return regret, total_reward
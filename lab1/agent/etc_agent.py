@@ -11,12 +11,21 @@ class EtcAgent(Agent):
         self.num_pulls = [0] * self.bandit.n_arms
         self.q_values = [0] * self.bandit.n_arms
         self.attempts = 0
+        self._committed_arm = None
+
+    def committed_arm(self) -> int | None:
+        if self.attempts < self.num_trials:
+            return None
+        # Commit once, to the best arm at the end of exploration.
+        if self._committed_arm is None:
+            self._committed_arm = int(np.argmax(self.q_values))
+        return self._committed_arm
 
     def play(self) -> Results:
         if self.attempts < self.num_trials:
             selected_arm = self.attempts % self.bandit.n_arms
         else:
-            selected_arm = np.argmax(self.q_values)
+            selected_arm = self.committed_arm()
         reward = self.bandit.pull(selected_arm)
         self.num_pulls[selected_arm] += 1
         self.q_values[selected_arm] = (
@@ -25,3 +34,12 @@ class EtcAgent(Agent):
         )
         self.attempts += 1
         return Results(selected_arm=selected_arm, reward=reward)
+
+    def commit(self, selected_arm: int, num_rounds: int, total_reward: float):
+        self.num_pulls[selected_arm] += num_rounds
+        self.q_values[selected_arm] = (
+            self.q_values[selected_arm]
+            + (total_reward - num_rounds * self.q_values[selected_arm])
+            / self.num_pulls[selected_arm]
+        )
+        self.attempts += num_rounds
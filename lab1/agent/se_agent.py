@@ -0,0 +1,70 @@
+import numpy as np
+
+from lab1.agent.agent import Agent, Results
+from lab1.bandit.base import Bandit
+
+
+class SuccessiveEliminationAgent(Agent):
+    def __init__(
+        self, bandit: Bandit, delta: float, c: float = 1, log_to_wandb: bool = True
+    ):
+        super().__init__(bandit, log_to_wandb)
+        self.delta = delta
+        if self.delta <= 0 or self.delta >= 1:
+            raise ValueError("delta must be between 0 and 1")
+        self.c = c
+        if self.c <= 0:
+            raise ValueError("c must be greater than 0")
+        # Statistics are kept only for surviving arms, compacted on elimination,
+        # so `num_pulls[i]` and `q_values[i]` belong to arm `active_arms[i]`.
+        self.active_arms = np.arange(self.bandit.n_arms)
+        self.num_pulls = np.zeros(self.bandit.n_arms, dtype=np.int64)
+        self.q_values = np.zeros(self.bandit.n_arms)
+        self.position = 0
+
+    def num_active_arms(self) -> int:
+        return len(self.active_arms)
+
+    def committed_arm(self) -> int | None:
+        if len(self.active_arms) > 1:
+            return None
+        return int(self.active_arms[0])
+
+    def play(self) -> Results:
+        # Pull the active arms round-robin and eliminate after each full sweep.
+        index = self.position
+        selected_arm = int(self.active_arms[index])
+        reward = self.bandit.pull(selected_arm)
+        self.num_pulls[index] += 1
+        self.q_values[index] = (
+            self.q_values[index]
+            + (reward - self.q_values[index]) / self.num_pulls[index]
+        )
+        self.position += 1
+        if self.position == len(self.active_arms):
+            self.position = 0
+            self._eliminate()
+        return Results(selected_arm=selected_arm, reward=reward)
+
+    def commit(self, selected_arm: int, num_rounds: int, total_reward: float):
+        self.num_pulls[0] += num_rounds
+        self.q_values[0] = (
+            self.q_values[0]
+            + (total_reward - num_rounds * self.q_values[0]) / self.num_pulls[0]
+        )
+
+    def _eliminate(self):
+        if len(self.active_arms) == 1:
+            return
+        # Unlike UCBAgent's fixed-level radius, elimination is permanent, so the
+        # bound is union-bounded over all K arms and every sweep (sum of 1/n^2):
+        # with probability at least 1 - delta the best arm is never eliminated.
+        # The log is split up so that n^2 cannot overflow the int64 counts.
+        log_term = np.log(4 * self.bandit.n_arms / self.delta) + 2 * np.log(
+            self.num_pulls
+        )
+        radius = self.c * np.sqrt(2 * log_term / self.num_pulls)
+        survivors = self.q_values + radius >= np.max(self.q_values - radius)
+        self.active_arms = self.active_arms[survivors]
+        self.num_pulls = self.num_pulls[survivors]
+        self.q_values = self.q_values[survivors]
@@ -9,3 +9,8 @@ class Arm(ABC):
     @abstractmethod
     def pull(self) -> float:
         raise NotImplementedError
+
+    def pull_sum(self, num_pulls: int) -> float:
+        # Sum of `num_pulls` independent rewards. Subclasses with a closed-form
+        # distribution for the sum should override this with a single draw.
+        return float(sum(self.pull() for _ in range(num_pulls)))
@@ -11,6 +11,10 @@ class GaussianArm(Arm):
     def pull(self):
         return np.random.normal(self._mean, self._std)
 
+    def pull_sum(self, num_pulls: int):
+        # The sum of n i.i.d. N(mu, sigma^2) draws is N(n * mu, n * sigma^2).
+        return np.random.normal(num_pulls * self._mean, np.sqrt(num_pulls) * self._std)
+
     def mean(self):
         return self._mean
 
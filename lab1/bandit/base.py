@@ -18,3 +18,6 @@ class Bandit(ABC):
 
     def pull(self, arm: int) -> float:
         return self.arms[arm].pull()
+
+    def pull_sum(self, arm: int, num_pulls: int) -> float:
+        return self.arms[arm].pull_sum(num_pulls)
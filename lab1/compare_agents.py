@@ -20,8 +20,10 @@ from rich.progress import (
 )
 from rich.table import Table
 
+from .agent.agent import expand_active_arms
 from .agent.eps_agent import EpsAgent
 from .agent.etc_agent import EtcAgent
+from .agent.se_agent import SuccessiveEliminationAgent
 from .agent.ucb_agent import UCBAgent
 from .bandit.gaussian import GaussianBandit
 
@@ -77,6 +79,8 @@ def run_agent_experiment(
     avg_regret = final_regret / num_rounds
     avg_reward = final_reward / num_rounds
     execution_time = end_time - start_time
+    active_arm_changes = results["active_arm_changes"]
+    final_active_arms = active_arm_changes[-1][1]
 
     # Log final metrics
     wandb.log(
@@ -86,6 +90,11 @@ def run_agent_experiment(
             "final_average_regret": avg_regret,
             "final_average_reward": avg_reward,
             "execution_time_seconds": execution_time,
+            "final_active_arms": final_active_arms,
+            "active_arm_changes": wandb.Table(
+                columns=["round", "active_arms"],
+                data=[list(change) for change in active_arm_changes],
+            ),
             "experiment_completed": True,
         }
     )
@@ -98,8 +107,10 @@ def run_agent_experiment(
         "avg_regret": avg_regret,
         "avg_reward": avg_reward,
         "execution_time": execution_time,
+        "final_active_arms": final_active_arms,
         "cumulative_regret": results["cumulative_regret"],
         "cumulative_reward": results["cumulative_reward"],
+        "active_arms": expand_active_arms(active_arm_changes, num_rounds),
     }
 
     wandb.finish()
@@ -143,6 +154,11 @@ def compare_all_agents(
             "params": {"delta": 0.05, "c": 1.5, "eps": 0.05},
             "name": "UCB_conservative",
         },
+        {
+            "class": SuccessiveEliminationAgent,
+            "params": {"delta": 0.1, "c": 1},
+            "name": "SuccessiveElimination",
+        },
     ]
 
     all_results = []
@@ -219,10 +235,16 @@ def compare_all_agents(
     for result in all_results:
         agent_name = result["agent_name"]
         if agent_name not in agent_summaries:
-            agent_summaries[agent_name] = {"regrets": [], "rewards": [], "times": []}
+            agent_summaries[agent_name] = {
+                "regrets": [],
+                "rewards": [],
+                "times": [],
+                "active_arms": [],
+            }
         agent_summaries[agent_name]["regrets"].append(result["avg_regret"])
         agent_summaries[agent_name]["rewards"].append(result["avg_reward"])
         agent_summaries[agent_name]["times"].append(result["execution_time"])
+        agent_summaries[agent_name]["active_arms"].append(result["final_active_arms"])
 
     summary_table = Table(
         title="Agent Performance Summary", show_header=True, header_style="bold magenta"
@@ -231,16 +253,19 @@ def compare_all_agents(
     summary_table.add_column("Avg Regret", justify="right", style="green")
     summary_table.add_column("Avg Reward", justify="right", style="yellow")
     summary_table.add_column("Avg Time (s)", justify="right", style="blue")
+    summary_table.add_column("Final Active Arms", justify="right", style="red")
 
     for agent_name, summary in agent_summaries.items():
         regrets = np.array(summary["regrets"])
         rewards = np.array(summary["rewards"])
         times = np.array(summary["times"])
+        active_arms = np.array(summary["active_arms"])
         summary_table.add_row(
             agent_name,
             f"{regrets.mean():.4f} ± {regrets.std():.4f}",
             f"{rewards.mean():.4f} ± {rewards.std():.4f}",
             f"{times.mean():.2f} ± {times.std():.2f}",
+            f"{active_arms.mean():.2f} ± {active_arms.std():.2f}",
         )
     console.print(summary_table)
 
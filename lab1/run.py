@@ -32,6 +32,7 @@ if __name__ == "__main__":
     # Uncomment to try different agents:
     # agent = EpsAgent(bandit, eps=0.1, alpha=0.1)
     # agent = EtcAgent(bandit, num_trials=10)
+    # agent = SuccessiveEliminationAgent(bandit, delta=0.1, c=1)
     agent = UCBAgent(bandit, delta=0.1, c=2, eps=0.1)
 
     # Log bandit information